@@ -1,6 +1,21 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import altair as alt
+
+from pv_constants import (
+    CONSO_BATIMENT,
+    CSS_RESULTATS,
+    EMOJI_METEO,
+    FACTEUR_METEO,
+    FMT_EFF,
+    FMT_EUR,
+    FMT_KWC,
+    FMT_KWH,
+    PANEL_DATA,
+    PUISSANCE_KWP_REF,
+    PUISSANCE_PAR_PANNEAU,
+    SURFACE_PAR_MODULE,
+)
 
 # CONFIGURATION
 st.set_page_config(page_title="Simulation Photovoltaïque ☀️", layout="centered")
@@ -8,70 +23,68 @@ st.set_page_config(page_title="Simulation Photovoltaïque ☀️", layout="cente
 st.title("☀️ Simulation d’un Système Photovoltaïque Résidentiel")
 st.markdown("Simulez la production, le rendement et l’injection selon vos choix de panneaux, météo et nombre de panneaux.")
 
-# ENTRÉES
-panneau = st.selectbox("🧱 Type de panneau solaire", ["Monocristallin", "Polycristallin", "Amorphe", "Hétérojonction", "Bifacial"])
-meteo = st.radio("🌦️ Conditions météorologiques", ["Ensoleillé", "Nuageux", "Pluvieux"])
-nb_panneaux = st.slider("🔢 Nombre de panneaux", 0, 25, 20)
-
-# DONNÉES DE BASE
-surface_par_module = 1.7  # m²
-surface_totale = nb_panneaux * surface_par_module
-puissance_par_panneau = 0.4  # kWc
-puissance_kWp = nb_panneaux * puissance_par_panneau
-puissance_kWp_ref = 8  # référence sur 20 panneaux mono 400 Wc
-
-# FACTEURS MÉTÉO
-facteur_meteo = {"Ensoleillé": 1.0, "Nuageux": 0.75, "Pluvieux": 0.55}[meteo]
-emoji_meteo = {"Ensoleillé": "☀️", "Nuageux": "☁️", "Pluvieux": "🌧️"}[meteo]
-
-# DONNÉES PAR TECHNOLOGIE
-data = {
-    "Monocristallin": {"rendement": 20.0, "prix": 1.20, "prod_ref": 11862},
-    "Polycristallin": {"rendement": 17.5, "prix": 1.00, "prod_ref": 10500},
-    "Amorphe": {"rendement": 10.0, "prix": 0.80, "prod_ref": 6000},
-    "Hétérojonction": {"rendement": 21.5, "prix": 1.50, "prod_ref": 12500},
-    "Bifacial": {"rendement": 19.5, "prix": 1.40, "prod_ref": 11200}
-}
 
 # CALCULS
-rendement = data[panneau]["rendement"]
-prod_ref = data[panneau]["prod_ref"]  # pour 8 kWc
-prix_watt = data[panneau]["prix"]
+def simuler(spec, nb_panneaux, facteur_meteo):
+    surface_totale = nb_panneaux * SURFACE_PAR_MODULE
+    puissance_kWp = nb_panneaux * PUISSANCE_PAR_PANNEAU
 
-production = (puissance_kWp / puissance_kWp_ref) * prod_ref * facteur_meteo
-efficacite = production / surface_totale if surface_totale else 0
-cout_total = puissance_kWp * 1000 * prix_watt
+    production = (puissance_kWp / PUISSANCE_KWP_REF) * spec.prod_ref * facteur_meteo
+    efficacite = production / surface_totale if surface_totale else 0
+    cout_total = puissance_kWp * 1000 * spec.prix
 
-# Hypothèse de consommation
-conso_batiment = 8260  # kWh/an
-autoconso = min(conso_batiment, production) * 0.9
-injecte = max(0, production - autoconso)
-reprise = max(0, conso_batiment - autoconso)
+    # Hypothèse de consommation
+    autoconso = min(CONSO_BATIMENT, production) * 0.9
+    injecte = max(0, production - autoconso)
+    reprise = max(0, CONSO_BATIMENT - autoconso)
+    return puissance_kWp, production, efficacite, cout_total, autoconso, injecte, reprise
 
-# AFFICHAGE
-st.subheader(f"{emoji_meteo} Résultats de simulation")
-col1, col2 = st.columns(2)
-col1.metric("Production estimée", f"{production:.0f} kWh/an")
-col2.metric("Puissance installée", f"{puissance_kWp:.2f} kWc")
 
-col1, col2 = st.columns(2)
-col1.metric("L’énergie produite par an ÷ surface utilisée", f"{efficacite:.1f} kWh/m²/an")
-col2.metric("Coût estimé panneaux", f"{cout_total:,.0f} €")
-
-st.markdown(f"📌 **Rendement du panneau _{panneau}_ : `{rendement:.1f}%`**")
-
-# GRAPHIQUE ÉNERGIE
-st.subheader("⚡ Répartition de l’énergie")
+# ENTRÉES
+panneau = st.selectbox("🧱 Type de panneau solaire", list(PANEL_DATA))
+meteo = st.radio("🌦️ Conditions météorologiques", list(FACTEUR_METEO))
+nb_panneaux = st.slider("🔢 Nombre de panneaux", 0, 25, 20)
 
-fig1, ax1 = plt.subplots()
-labels = ["Autoconsommée", "Injectée au réseau", "Reprise réseau"]
-values = [autoconso, injecte, reprise]
-colors = ["green", "orange", "red"]
-ax1.bar(labels, values, color=colors)
-ax1.set_ylabel("Énergie (kWh)")
-ax1.set_title("Répartition annuelle de l'énergie")
-ax1.grid(axis='y')
-st.pyplot(fig1)
+if nb_panneaux == 0:
+    st.warning("Sélectionnez au moins un panneau")
+else:
+    facteur_meteo = FACTEUR_METEO[meteo]
+    emoji_meteo = EMOJI_METEO[meteo]
+    spec = PANEL_DATA[panneau]
+    rendement = spec.rendement
+    puissance_kWp, production, efficacite, cout_total, autoconso, injecte, reprise = simuler(spec, nb_panneaux, facteur_meteo)
+
+    # AFFICHAGE
+    st.subheader(f"{emoji_meteo} Résultats de simulation")
+    cartes = [
+        ("Production estimée", FMT_KWH(production)),
+        ("Puissance installée", FMT_KWC(puissance_kWp)),
+        ("L’énergie produite par an ÷ surface utilisée", FMT_EFF(efficacite)),
+        ("Coût estimé panneaux", FMT_EUR(cout_total)),
+    ]
+    html = (
+        f"{CSS_RESULTATS}<div class='pv-grille'>"
+        + "".join(
+            f"<div class='pv-carte'><div class='pv-libelle'>{libelle}</div><div class='pv-valeur'>{valeur}</div></div>"
+            for libelle, valeur in cartes
+        )
+        + f"</div><p>📌 <b>Rendement du panneau <i>{panneau}</i> : <code>{rendement:.1f}%</code></b></p>"
+    )
+    st.markdown(html, unsafe_allow_html=True)
+
+    # GRAPHIQUE ÉNERGIE
+    st.subheader("⚡ Répartition de l’énergie")
+
+    labels = ["Autoconsommée", "Injectée au réseau", "Reprise réseau"]
+    values = [autoconso, injecte, reprise]
+    colors = ["green", "orange", "red"]
+    df_energie = pd.DataFrame({"Poste": labels, "Énergie": values})
+    graphique = alt.Chart(df_energie, title="Répartition annuelle de l'énergie").mark_bar().encode(
+        x=alt.X("Poste:N", sort=labels, title=None),
+        y=alt.Y("Énergie:Q", title="Énergie (kWh)"),
+        color=alt.Color("Poste:N", scale=alt.Scale(domain=labels, range=colors), legend=None),
+    )
+    st.altair_chart(graphique)
 
 # SIGNATURE
 st.markdown("---")
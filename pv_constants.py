@@ -0,0 +1,39 @@
+# CONSTANTES DE LA SIMULATION (importées une seule fois par processus)
+from collections import namedtuple
+
+# DONNÉES DE BASE
+SURFACE_PAR_MODULE = 1.7  # m²
+PUISSANCE_PAR_PANNEAU = 0.4  # kWc
+PUISSANCE_KWP_REF = 8  # référence sur 20 panneaux mono 400 Wc
+CONSO_BATIMENT = 8260  # kWh/an
+
+# FACTEURS MÉTÉO
+FACTEUR_METEO = {"Ensoleillé": 1.0, "Nuageux": 0.75, "Pluvieux": 0.55}
+EMOJI_METEO = {"Ensoleillé": "☀️", "Nuageux": "☁️", "Pluvieux": "🌧️"}
+
+# DONNÉES PAR TECHNOLOGIE (prod_ref : kWh/an pour 8 kWc)
+PanelSpec = namedtuple("PanelSpec", "rendement prix prod_ref")
+PANEL_DATA = {
+    "Monocristallin": PanelSpec(20.0, 1.20, 11862),
+    "Polycristallin": PanelSpec(17.5, 1.00, 10500),
+    "Amorphe": PanelSpec(10.0, 0.80, 6000),
+    "Hétérojonction": PanelSpec(21.5, 1.50, 12500),
+    "Bifacial": PanelSpec(19.5, 1.40, 11200)
+}
+
+# FORMATS D'AFFICHAGE
+FMT_KWH = "{:.0f} kWh/an".format
+FMT_KWC = "{:.2f} kWc".format
+FMT_EFF = "{:.1f} kWh/m²/an".format
+FMT_EUR = "{:,.0f} €".format
+
+# STYLE DES RÉSULTATS (grille 2×2 de cartes, rendue en un seul st.markdown)
+# Bloc <style> global renvoyé à chaque rerun ; tailles et opacité fixes,
+# indépendantes du thème Streamlit (les couleurs héritent du texte courant).
+CSS_RESULTATS = """<style>
+.pv-grille {display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-bottom: 1rem;}
+@media (max-width: 640px) {.pv-grille {grid-template-columns: 1fr;}}
+.pv-carte {padding: 0.5rem 0;}
+.pv-libelle {font-size: 0.875rem; opacity: 0.7;}
+.pv-valeur {font-size: 1.75rem;}
+</style>"""